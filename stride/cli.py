@@ -9,6 +9,7 @@ from rich.panel import Panel
 from rich.align import Align
 from stride import __version__
 from stride.commands import init, list, status, show, validate, metrics, docs, auth
+from stride.utils import set_now_context
 
 # Initialize Typer app
 app = typer.Typer(
@@ -42,6 +43,9 @@ def main(
     """
     Stride CLI entry point.
     """
+    # Pin the relative-timestamp reference clock once per invocation
+    set_now_context()
+
     if ctx.invoked_subcommand is None:
         # Generate ASCII art
         f = pyfiglet.Figlet(font='slant')
@@ -32,10 +32,11 @@ def list_sprints(
         console.print("[yellow]No sprints found.[/yellow]")
         return
 
-    # Load progress data for each sprint
+    # Load progress data for each sprint; compact mode only renders task
+    # counts, so skip materializing stride models and logs for it
     detailed_sprints = []
     for sprint in sprints:
-        detailed = manager.get_sprint(sprint.id, include_progress=True)
+        detailed = manager.get_sprint(sprint.id, include_progress=True, lite_progress=not verbose)
         if detailed:
             detailed_sprints.append(detailed)
 
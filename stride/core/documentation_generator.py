@@ -2,6 +2,11 @@
 Logic for generating project documentation from completed sprints.
 """
 
+import functools
+import hashlib
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from pathlib import Path
 from datetime import datetime
@@ -20,6 +25,37 @@ from ..constants import (
 from .sprint_manager import SprintManager
 
 
+# Section heads matched once per file instead of per-line startswith chains.
+_DESC_HEAD = re.compile(r"^[ \t]*##\s+Description", re.M)
+_SUMMARY_HEAD = re.compile(r"##\s+(?:Summary|What We Built)")
+_H2_HEAD = re.compile(r"^[ \t]*##\s", re.M)
+_H1_HEAD = re.compile(r"^# (.+)$", re.M)
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_cached(path_str: str, mtime_ns: int) -> str:
+    """Read a file, memoized on (path, mtime) so unchanged files are read once
+    per process regardless of which generator instance asks."""
+    return Path(path_str).read_text(encoding="utf-8")
+
+
+def _extract_section_text(content: str, head_pattern) -> str:
+    """Return the flattened text between a section head and the next H2."""
+    match = head_pattern.search(content)
+    if not match:
+        return ""
+
+    start = content.find("\n", match.end())
+    if start == -1:
+        return ""
+    start += 1
+
+    end_match = _H2_HEAD.search(content, start)
+    end = end_match.start() if end_match else len(content)
+
+    return " ".join(line.strip() for line in content[start:end].split("\n") if line.strip())
+
+
 class DocumentationGenerator:
     """Generator for project documentation from sprint data."""
 
@@ -47,41 +83,60 @@ class DocumentationGenerator:
             List of completed Sprint objects with full details
         """
         all_sprints = self.sprint_manager.list_sprints()
-        completed = [
-            self.sprint_manager.get_sprint_details(sprint.id)
-            for sprint in all_sprints
-            if sprint.status == SprintStatus.COMPLETED
-        ]
+        completed_ids = [s.id for s in all_sprints if s.status == SprintStatus.COMPLETED]
+
+        if not completed_ids:
+            return []
+
+        # Each details call is a bundle of independent small file reads, so
+        # threads overlap the I/O latency (read() releases the GIL).
+        with ThreadPoolExecutor(max_workers=min(8, len(completed_ids))) as executor:
+            completed = list(executor.map(self.sprint_manager.get_sprint_details, completed_ids))
+
         return [s for s in completed if s is not None]
 
-    def read_sprint_files(self, sprint: Sprint) -> Dict[str, str]:
+    def read_sprint_files(
+        self, sprint: Sprint, file_names: Optional[List[str]] = None
+    ) -> Dict[str, str]:
         """
-        Read all sprint files and return their contents.
+        Read sprint files and return their contents.
 
         Args:
             sprint: Sprint object
+            file_names: Specific files to read; defaults to all sprint files.
+                Callers that only parse one or two files should pass them
+                explicitly to skip the unused reads.
 
         Returns:
             Dictionary mapping file names to their contents
         """
-        sprint_path = Path(sprint.path)
+        # Plain string joins: PurePath.__truediv__ reparses the path on every
+        # `/`, which is measurable across thousands of sprint files.
+        base = sprint.path if isinstance(sprint.path, str) else str(sprint.path)
         files = {}
 
-        file_names = [
-            FILE_PROPOSAL,
-            FILE_PLAN,
-            FILE_DESIGN,
-            FILE_IMPLEMENTATION,
-            FILE_RETROSPECTIVE,
-        ]
+        if file_names is None:
+            file_names = [
+                FILE_PROPOSAL,
+                FILE_PLAN,
+                FILE_DESIGN,
+                FILE_IMPLEMENTATION,
+                FILE_RETROSPECTIVE,
+            ]
 
         for file_name in file_names:
-            file_path = sprint_path / file_name
-            if file_path.exists():
-                try:
-                    files[file_name] = file_path.read_text(encoding="utf-8")
-                except Exception:
-                    files[file_name] = ""
+            file_path = os.path.join(base, file_name)
+            try:
+                mtime_ns = os.stat(file_path).st_mtime_ns
+            except OSError:
+                continue
+
+            # The mtime in the cache key makes stale entries unreachable, so
+            # edited files are re-read while unchanged ones come from memory.
+            try:
+                files[file_name] = _read_cached(file_path, mtime_ns)
+            except Exception:
+                files[file_name] = ""
 
         return files
 
@@ -98,7 +153,9 @@ class DocumentationGenerator:
         features = []
 
         for sprint in sprints:
-            files = self.read_sprint_files(sprint)
+            # Only the proposal and retrospective are parsed below; skip the
+            # plan/design/implementation reads entirely.
+            files = self.read_sprint_files(sprint, [FILE_PROPOSAL, FILE_RETROSPECTIVE])
 
             # Extract feature name from proposal
             feature_name = sprint.title
@@ -107,40 +164,13 @@ class DocumentationGenerator:
 
             # Parse proposal for description
             if FILE_PROPOSAL in files:
-                proposal = files[FILE_PROPOSAL]
-                # Extract description section if present
-                lines = proposal.split("\n")
-                in_desc = False
-                desc_lines = []
-
-                for line in lines:
-                    if line.strip().startswith("## Description"):
-                        in_desc = True
-                        continue
-                    elif line.strip().startswith("##") and in_desc:
-                        break
-                    elif in_desc and line.strip():
-                        desc_lines.append(line.strip())
-
-                description = " ".join(desc_lines)
+                description = _extract_section_text(files[FILE_PROPOSAL], _DESC_HEAD)
 
             # Extract implementation summary from retrospective
             if FILE_RETROSPECTIVE in files:
-                retro = files[FILE_RETROSPECTIVE]
-                lines = retro.split("\n")
-                in_summary = False
-                summary_lines = []
-
-                for line in lines:
-                    if "## Summary" in line or "## What We Built" in line:
-                        in_summary = True
-                        continue
-                    elif line.strip().startswith("##") and in_summary:
-                        break
-                    elif in_summary and line.strip():
-                        summary_lines.append(line.strip())
-
-                implementation_notes = " ".join(summary_lines)
+                implementation_notes = _extract_section_text(
+                    files[FILE_RETROSPECTIVE], _SUMMARY_HEAD
+                )
 
             features.append(
                 {
@@ -153,6 +183,29 @@ class DocumentationGenerator:
 
         return features
 
+    def _docs_signature(self, completed_sprints: List[Sprint]) -> str:
+        """
+        Fingerprint of everything the generated docs are derived from.
+
+        Built from file mtimes rather than contents, so a no-op check costs a
+        handful of stat calls.
+        """
+        parts = []
+        try:
+            parts.append(str(self.project_file.stat().st_mtime_ns))
+        except OSError:
+            parts.append("-")
+
+        for sprint in completed_sprints:
+            parts.append(sprint.id)
+            for file_name in (FILE_PROPOSAL, FILE_RETROSPECTIVE):
+                try:
+                    parts.append(str(os.stat(os.path.join(str(sprint.path), file_name)).st_mtime_ns))
+                except OSError:
+                    parts.append("-")
+
+        return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
     def generate_index(self, project_name: str, features: List[Dict[str, str]]) -> str:
         """
         Generate index.md content.
@@ -164,31 +217,35 @@ class DocumentationGenerator:
         Returns:
             Markdown content for index.md
         """
-        content = f"# {project_name}\n\n"
-        content += "## Overview\n\n"
-        content += (
+        # Accumulate chunks and join once: += rebuilds the string each time,
+        # which goes quadratic as the feature list grows.
+        parts = [
+            f"# {project_name}\n\n",
+            "## Overview\n\n",
             f"This is the documentation for **{project_name}**, "
-            "built using the Stride framework for sprint-powered development.\n\n"
-        )
+            "built using the Stride framework for sprint-powered development.\n\n",
+            "## Features\n\n",
+        ]
 
-        content += "## Features\n\n"
         if features:
             for feature in features:
-                content += f"- **{feature['name']}**"
-                if feature["description"]:
-                    content += f": {feature['description'][:100]}"
-                    if len(feature["description"]) > 100:
-                        content += "..."
-                content += "\n"
+                description = feature["description"]
+                if description:
+                    ellipsis = "..." if len(description) > 100 else ""
+                    parts.append(f"- **{feature['name']}**: {description[:100]}{ellipsis}\n")
+                else:
+                    parts.append(f"- **{feature['name']}**\n")
         else:
-            content += "*No completed features yet.*\n"
+            parts.append("*No completed features yet.*\n")
 
-        content += "\n## Project Structure\n\n"
-        content += "This documentation is organized as follows:\n\n"
-        content += "- **Features**: Detailed documentation of implemented features\n"
-        content += "- **Getting Started**: Guide to setting up and using the project\n\n"
+        parts.append(
+            "\n## Project Structure\n\n"
+            "This documentation is organized as follows:\n\n"
+            "- **Features**: Detailed documentation of implemented features\n"
+            "- **Getting Started**: Guide to setting up and using the project\n\n"
+        )
 
-        return content
+        return "".join(parts)
 
     def generate_features_docs(self, features: List[Dict[str, str]]) -> str:
         """
@@ -200,25 +257,27 @@ class DocumentationGenerator:
         Returns:
             Markdown content for features.md
         """
-        content = "# Features\n\n"
-        content += "This page documents all implemented features in the project.\n\n"
+        parts = [
+            "# Features\n\n",
+            "This page documents all implemented features in the project.\n\n",
+        ]
 
         if not features:
-            content += "*No features have been completed yet.*\n"
-            return content
+            parts.append("*No features have been completed yet.*\n")
+            return "".join(parts)
 
         for i, feature in enumerate(features, 1):
-            content += f"## {i}. {feature['name']}\n\n"
+            parts.append(f"## {i}. {feature['name']}\n\n")
 
             if feature["description"]:
-                content += f"**Description**: {feature['description']}\n\n"
+                parts.append(f"**Description**: {feature['description']}\n\n")
 
             if feature["implementation"]:
-                content += f"**Implementation**: {feature['implementation']}\n\n"
+                parts.append(f"**Implementation**: {feature['implementation']}\n\n")
 
-            content += "---\n\n"
+            parts.append("---\n\n")
 
-        return content
+        return "".join(parts)
 
     def generate_getting_started(self, project_name: str) -> str:
         """
@@ -230,26 +289,23 @@ class DocumentationGenerator:
         Returns:
             Markdown content for getting-started.md
         """
-        content = "# Getting Started\n\n"
-        content += f"Welcome to **{project_name}**!\n\n"
-        content += "## Prerequisites\n\n"
-        content += "List your prerequisites here:\n\n"
-        content += "- Requirement 1\n"
-        content += "- Requirement 2\n"
-        content += "- Requirement 3\n\n"
-
-        content += "## Installation\n\n"
-        content += "```bash\n"
-        content += "# Add installation steps here\n"
-        content += "```\n\n"
-
-        content += "## Configuration\n\n"
-        content += "Describe configuration steps here.\n\n"
-
-        content += "## Usage\n\n"
-        content += "Provide usage examples here.\n\n"
-
-        return content
+        return (
+            "# Getting Started\n\n"
+            f"Welcome to **{project_name}**!\n\n"
+            "## Prerequisites\n\n"
+            "List your prerequisites here:\n\n"
+            "- Requirement 1\n"
+            "- Requirement 2\n"
+            "- Requirement 3\n\n"
+            "## Installation\n\n"
+            "```bash\n"
+            "# Add installation steps here\n"
+            "```\n\n"
+            "## Configuration\n\n"
+            "Describe configuration steps here.\n\n"
+            "## Usage\n\n"
+            "Provide usage examples here.\n\n"
+        )
 
     def create_mkdocs_config(self, project_name: str) -> str:
         """
@@ -306,16 +362,28 @@ extra:
         # Get completed sprints
         completed_sprints = self.get_completed_sprints()
 
+        # If nothing the docs derive from has changed and the outputs are
+        # still in place, leave the files (and their mtimes) alone so
+        # mkdocs serve, git, and CI caches stay warm.
+        signature = self._docs_signature(completed_sprints)
+        hash_file = self.stride_dir / ".docs_hash"
+        output_names = ("index.md", "features.md", "getting-started.md", "mkdocs.yml")
+        try:
+            if hash_file.read_text(encoding="utf-8") == signature and all(
+                (self.docs_dir / name).exists() for name in output_names
+            ):
+                return True
+        except OSError:
+            pass
+
         # Extract project name
         project_name = "Project"
         if self.project_file.exists():
             try:
                 content = self.project_file.read_text(encoding="utf-8")
-                lines = content.split("\n")
-                for line in lines:
-                    if line.startswith("# "):
-                        project_name = line[2:].strip()
-                        break
+                match = _H1_HEAD.search(content)
+                if match:
+                    project_name = match.group(1).strip()
             except Exception:
                 pass
 
@@ -327,24 +395,31 @@ extra:
 
         # Generate documentation files
         try:
-            # index.md
-            index_content = self.generate_index(project_name, features)
-            (self.docs_dir / "index.md").write_text(index_content, encoding="utf-8")
-
-            # features.md
-            features_content = self.generate_features_docs(features)
-            (self.docs_dir / "features.md").write_text(features_content, encoding="utf-8")
-
-            # getting-started.md
-            getting_started = self.generate_getting_started(project_name)
-            (self.docs_dir / "getting-started.md").write_text(
-                getting_started, encoding="utf-8"
-            )
+            outputs = {
+                "index.md": self.generate_index(project_name, features),
+                "features.md": self.generate_features_docs(features),
+                "getting-started.md": self.generate_getting_started(project_name),
+                "mkdocs.yml": self.create_mkdocs_config(project_name),
+            }
+
+            # The four files are independent: encode each once and let the
+            # writes overlap (write/close release the GIL). Files whose
+            # bytes are already current are not rewritten.
+            def _write(item):
+                file_name, content = item
+                target = self.docs_dir / file_name
+                data = content.encode("utf-8")
+                try:
+                    if target.read_bytes() == data:
+                        return
+                except OSError:
+                    pass
+                target.write_bytes(data)
 
-            # mkdocs.yml
-            mkdocs_config = self.create_mkdocs_config(project_name)
-            (self.docs_dir / "mkdocs.yml").write_text(mkdocs_config, encoding="utf-8")
+            with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+                list(executor.map(_write, outputs.items()))
 
+            hash_file.write_text(signature, encoding="utf-8")
             return True
         except Exception:
             return False
@@ -7,6 +7,8 @@ Current file operations are handled directly in command implementations.
 
 from pathlib import Path
 
+__all__ = ["FileManager"]
+
 
 class FileManager:
     """
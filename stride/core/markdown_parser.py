@@ -11,6 +11,8 @@ from pathlib import Path
 class CheckboxItem:
     """Represents a checkbox item from markdown."""
 
+    __slots__ = ("text", "checked", "line_number")
+
     def __init__(self, text: str, checked: bool, line_number: int = 0):
         self.text = text
         self.checked = checked
@@ -20,6 +22,8 @@ class CheckboxItem:
 class StrideInfo:
     """Represents a stride milestone from plan.md."""
 
+    __slots__ = ("number", "name", "purpose", "tasks", "completion_definition")
+
     def __init__(
         self,
         number: int,
@@ -38,6 +42,8 @@ class StrideInfo:
 class ImplementationLogEntry:
     """Represents a single log entry from implementation.md."""
 
+    __slots__ = ("timestamp", "stride_name", "tasks_addressed", "decisions", "notes", "changes")
+
     def __init__(
         self,
         timestamp: str,
@@ -63,6 +69,41 @@ class MarkdownParser:
     HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$")
     STRIDE_HEADING_PATTERN = re.compile(r"###\s+\*\*Stride\s+(\d+):\s+(.+?)\*\*")
     TIMESTAMP_PATTERN = re.compile(r"##\s+\[Timestamp:\s+([^\]]+)\]\s+Stride:\s+(.+)")
+    TIMESTAMP_LINE_PATTERN = re.compile(
+        r"^##\s+\[Timestamp:\s+([^\]]+)\]\s+Stride:\s+(.+?)\s*$", re.M
+    )
+    # A named log subsection and its body, ending at the next heading,
+    # horizontal rule, or end of entry.
+    LOG_SECTION_PATTERN = re.compile(
+        r"^### (Tasks Addressed|Decisions|Notes|Changes Made)[ \t]*\n(.*?)(?=^### |^---|\Z)",
+        re.M | re.S,
+    )
+    # Bullet items, excluding template placeholders like "- [Task name]".
+    LOG_ITEM_PATTERN = re.compile(r"^-[ \t]*(?!\[)(\S.*?)[ \t]*$", re.M)
+
+    # Multiline variants driving the C regex engine over the whole buffer
+    # instead of Python-level per-line loops.
+    # Leading whitespace is [ \t] only: with re.M a bare \s* could swallow a
+    # preceding blank line and shift match positions (and thus line numbers).
+    CHECKBOX_LINE_PATTERN = re.compile(r"^[ \t]*-\s+\[([ xX])\]\s+(.+?)\s*$", re.M)
+    H1_PATTERN = re.compile(r"^# (.+)$", re.M)
+    # Heading-or-checkbox alternation for single-pass category grouping.
+    HEADING_OR_CHECKBOX_PATTERN = re.compile(
+        r"^(?:(#{1,6})\s+(.+?)|[ \t]*-\s+\[([ xX])\]\s+(.+?))\s*$", re.M
+    )
+    CHECKBOX_ANY_PATTERN = re.compile(r"^\s*-\s+\[[ xX]\]\s+\S", re.M)
+    CHECKBOX_CHECKED_PATTERN = re.compile(r"^\s*-\s+\[[xX]\]\s+\S", re.M)
+    TITLE_PREFIX_PATTERN = re.compile(r"^(Proposal|Plan|Implementation|Design|Retrospective):\s*")
+    # Structural markers in plan.md: a stride heading, a section label, or a
+    # terminator. Everything between two markers is section body text.
+    STRIDE_MARKER_PATTERN = re.compile(
+        r"^(?:"
+        r"###\s+\*\*Stride\s+(\d+):\s+(.+?)\*\*"  # group 1, 2: stride heading
+        r"|\*\*(Purpose|Tasks|Completion Definition):\*\*"  # group 3: section
+        r"|(###|---)"  # group 4: terminator
+        r")",
+        re.M,
+    )
 
     @staticmethod
     def parse_checkboxes(content: str) -> List[CheckboxItem]:
@@ -75,19 +116,38 @@ class MarkdownParser:
         Returns:
             List of CheckboxItem objects
         """
+        # One multiline scan; line numbers are kept as a running count over
+        # the gaps between matches, so the whole pass stays O(n).
         items = []
-        lines = content.split("\n")
+        line_number = 1
+        scan_pos = 0
 
-        for line_num, line in enumerate(lines, 1):
-            match = MarkdownParser.CHECKBOX_PATTERN.match(line)
-            if match:
-                check_state = match.group(1)
-                text = match.group(2).strip()
-                checked = check_state.lower() == "x"
-                items.append(CheckboxItem(text, checked, line_num))
+        for match in MarkdownParser.CHECKBOX_LINE_PATTERN.finditer(content):
+            line_number += content.count("\n", scan_pos, match.start())
+            scan_pos = match.start()
+            items.append(
+                CheckboxItem(match.group(2).strip(), match.group(1).lower() == "x", line_number)
+            )
 
         return items
 
+    @staticmethod
+    def count_checkboxes(content: str) -> Tuple[int, int]:
+        """
+        Count checked and total checkboxes without building CheckboxItem objects.
+
+        Args:
+            content: Markdown content containing checkboxes
+
+        Returns:
+            Tuple of (completed_count, total_count)
+        """
+        # Two findall passes stay entirely in the regex engine; callers that
+        # only need percentages avoid one object allocation per checkbox.
+        completed = len(MarkdownParser.CHECKBOX_CHECKED_PATTERN.findall(content))
+        total = len(MarkdownParser.CHECKBOX_ANY_PATTERN.findall(content))
+        return completed, total
+
     @staticmethod
     def extract_section(content: str, heading: str, level: int = 2) -> str:
         """
@@ -135,64 +195,55 @@ class MarkdownParser:
             List of StrideInfo objects
         """
         strides = []
-        lines = content.split("\n")
         current_stride = None
-        current_section = None
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        # One C-level scan finds every structural marker; Python only touches
+        # the body slices between a section label and the next marker.
+        matches = list(MarkdownParser.STRIDE_MARKER_PATTERN.finditer(content))
 
-            # Match stride heading
-            stride_match = MarkdownParser.STRIDE_HEADING_PATTERN.match(line)
-            if stride_match:
-                # Save previous stride
+        for index, match in enumerate(matches):
+            if match.group(1):
+                # Stride heading: save the previous stride, start a new one
                 if current_stride:
                     strides.append(current_stride)
+                current_stride = StrideInfo(int(match.group(1)), match.group(2).strip())
+                continue
 
-                # Start new stride
-                number = int(stride_match.group(1))
-                name = stride_match.group(2).strip()
-                current_stride = StrideInfo(number, name)
-                current_section = None
-                i += 1
+            if current_stride is None or not match.group(3):
+                # Terminators just close the current section, which is
+                # implicit here because body slices end at the next marker.
                 continue
 
-            # If we're in a stride, check for subsections
-            if current_stride:
-                if line.startswith("**Purpose:**"):
-                    current_section = "purpose"
-                    i += 1
-                    continue
-                elif line.startswith("**Tasks:**"):
-                    current_section = "tasks"
-                    i += 1
-                    continue
-                elif line.startswith("**Completion Definition:**"):
-                    current_section = "completion"
-                    i += 1
-                    continue
-                elif line.startswith("###") or line.startswith("---"):
-                    # End of current stride
-                    if line.startswith("###") and "Stride" in line:
-                        # Let the next iteration handle this
-                        continue
-                    current_section = None
-
-                # Add content to current section
-                if current_section == "purpose" and line.strip() and not line.startswith("["):
-                    current_stride.purpose += line.strip() + " "
-                elif current_section == "tasks":
-                    checkbox_match = MarkdownParser.CHECKBOX_PATTERN.match(line)
-                    if checkbox_match:
-                        check_state = checkbox_match.group(1)
-                        text = checkbox_match.group(2).strip()
-                        checked = check_state.lower() == "x"
-                        current_stride.tasks.append(CheckboxItem(text, checked, i + 1))
-                elif current_section == "completion" and line.strip() and not line.startswith("["):
-                    current_stride.completion_definition += line.strip() + " "
-
-            i += 1
+            # Body runs from the line after the section label to the next
+            # structural marker (or end of file).
+            line_end = content.find("\n", match.end())
+            body_start = len(content) if line_end == -1 else line_end + 1
+            body_end = matches[index + 1].start() if index + 1 < len(matches) else len(content)
+            body = content[body_start:body_end]
+
+            section = match.group(3)
+            if section == "Tasks":
+                for task_match in MarkdownParser.CHECKBOX_LINE_PATTERN.finditer(body):
+                    line_number = content.count("\n", 0, body_start + task_match.start()) + 1
+                    current_stride.tasks.append(
+                        CheckboxItem(
+                            task_match.group(2).strip(),
+                            task_match.group(1).lower() == "x",
+                            line_number,
+                        )
+                    )
+            else:
+                parts = [
+                    line.strip()
+                    for line in body.split("\n")
+                    if line.strip() and not line.startswith("[")
+                ]
+                if parts:
+                    text = " ".join(parts) + " "
+                    if section == "Purpose":
+                        current_stride.purpose += text
+                    else:
+                        current_stride.completion_definition += text
 
         # Don't forget the last stride
         if current_stride:
@@ -214,66 +265,38 @@ class MarkdownParser:
         Returns:
             List of ImplementationLogEntry objects
         """
+        # Timestamp headings delimit entries; each body between two headings
+        # is parsed with a couple of C-level regex scans instead of a
+        # per-line Python state machine.
         entries = []
-        lines = content.split("\n")
-        current_entry = None
-        current_section = None
+        matches = list(MarkdownParser.TIMESTAMP_LINE_PATTERN.finditer(content))
 
-        for line in lines:
-            # Match timestamp heading
-            timestamp_match = MarkdownParser.TIMESTAMP_PATTERN.match(line)
-            if timestamp_match:
-                # Save previous entry
-                if current_entry:
-                    entries.append(current_entry)
-
-                # Start new entry
-                timestamp = timestamp_match.group(1).strip()
-                stride_name = timestamp_match.group(2).strip()
-                current_entry = ImplementationLogEntry(timestamp, stride_name)
-                current_section = None
-                continue
+        # Only the most recent entries are returned, so don't parse the
+        # bodies of anything older than the cutoff.
+        if limit:
+            matches = matches[-limit:]
+
+        section_attrs = {
+            "Tasks Addressed": "tasks_addressed",
+            "Decisions": "decisions",
+            "Notes": "notes",
+            "Changes Made": "changes",
+        }
+
+        for index, match in enumerate(matches):
+            entry = ImplementationLogEntry(match.group(1).strip(), match.group(2).strip())
+            body_end = matches[index + 1].start() if index + 1 < len(matches) else len(content)
+            body = content[match.end() : body_end]
+
+            for section_match in MarkdownParser.LOG_SECTION_PATTERN.finditer(body):
+                getattr(entry, section_attrs[section_match.group(1)]).extend(
+                    MarkdownParser.LOG_ITEM_PATTERN.findall(section_match.group(2))
+                )
 
-            # If we're in an entry, check for subsections
-            if current_entry:
-                if line.startswith("### Tasks Addressed"):
-                    current_section = "tasks"
-                    continue
-                elif line.startswith("### Decisions"):
-                    current_section = "decisions"
-                    continue
-                elif line.startswith("### Notes"):
-                    current_section = "notes"
-                    continue
-                elif line.startswith("### Changes Made"):
-                    current_section = "changes"
-                    continue
-                elif line.startswith("---"):
-                    current_section = None
-                    continue
-
-                # Add content to current section
-                if current_section and line.strip() and line.startswith("-"):
-                    item = line.strip()[1:].strip()  # Remove leading dash
-                    if not item.startswith("[") and item:  # Skip template placeholders
-                        if current_section == "tasks":
-                            current_entry.tasks_addressed.append(item)
-                        elif current_section == "decisions":
-                            current_entry.decisions.append(item)
-                        elif current_section == "notes":
-                            current_entry.notes.append(item)
-                        elif current_section == "changes":
-                            current_entry.changes.append(item)
-
-        # Don't forget the last entry
-        if current_entry:
-            entries.append(current_entry)
+            entries.append(entry)
 
         # Return most recent first
         entries.reverse()
-
-        if limit:
-            return entries[:limit]
         return entries
 
     @staticmethod
@@ -287,16 +310,15 @@ class MarkdownParser:
         Returns:
             Title text or empty string if not found
         """
-        lines = content.split("\n")
-        for line in lines:
-            if line.startswith("# "):
-                title = line[2:].strip()
-                # Remove common prefixes
-                title = re.sub(
-                    r"^(Proposal|Plan|Implementation|Design|Retrospective):\s*", "", title
-                )
-                return title
-        return ""
+        # One multiline search beats splitting the whole document into a
+        # line list just to read its first H1.
+        match = MarkdownParser.H1_PATTERN.search(content)
+        if not match:
+            return ""
+
+        title = match.group(1).strip()
+        # Remove common prefixes
+        return MarkdownParser.TITLE_PREFIX_PATTERN.sub("", title)
 
     @staticmethod
     def calculate_completion(checkboxes: List[CheckboxItem]) -> Tuple[int, int, float]:
@@ -330,29 +352,22 @@ class MarkdownParser:
             Dictionary mapping category names to checkbox lists
         """
         groups = {}
-        lines = content.split("\n")
         current_category = "General"
 
-        for line_num, line in enumerate(lines, 1):
-            # Check for heading
-            heading_match = MarkdownParser.HEADING_PATTERN.match(line)
-            if heading_match:
-                heading_text = heading_match.group(2).strip()
+        # One alternation pass: the C regex engine skips plain text, and
+        # line numbers are computed only for the checkbox hits.
+        for match in MarkdownParser.HEADING_OR_CHECKBOX_PATTERN.finditer(content):
+            if match.group(1):
                 # Use h3 and h4 as categories
-                if heading_match.group(1) in ["###", "####"]:
-                    current_category = heading_text
-                    if current_category not in groups:
-                        groups[current_category] = []
-
-            # Check for checkbox
-            checkbox_match = MarkdownParser.CHECKBOX_PATTERN.match(line)
-            if checkbox_match:
-                check_state = checkbox_match.group(1)
-                text = checkbox_match.group(2).strip()
-                checked = check_state.lower() == "x"
-
-                if current_category not in groups:
-                    groups[current_category] = []
-                groups[current_category].append(CheckboxItem(text, checked, line_num))
+                if match.group(1) in ("###", "####"):
+                    current_category = match.group(2).strip()
+                    groups.setdefault(current_category, [])
+            else:
+                line_number = content.count("\n", 0, match.start()) + 1
+                groups.setdefault(current_category, []).append(
+                    CheckboxItem(
+                        match.group(4).strip(), match.group(3).lower() == "x", line_number
+                    )
+                )
 
         return groups
@@ -2,57 +2,175 @@
 Metrics calculator for sprint analytics.
 """
 
+import math
 import statistics
+from bisect import bisect_right
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from ..models import SprintData
 
 
+# Shape of the metrics dict when there is no sprint data; callers get a
+# fresh shallow copy so they can mutate their result freely.
+_EMPTY_METRICS = {
+    "counts": {"total_sprints": 0},
+    "duration": {"has_duration_data": False},
+    "tasks": {"total_tasks": 0},
+    "quality": {"process_adoption_rate": 0},
+    "trends": {"has_trend_data": False},
+    "summary": {"health_score": 0, "productivity_level": "none"},
+}
+
+
+def _sample_stdev(values: List[float], mean: float) -> float:
+    """Sample standard deviation from a precomputed mean.
+
+    statistics.stdev routes every element through exact-ratio arithmetic;
+    float math is plenty for display metrics and runs at C speed.
+    """
+    return math.sqrt(sum((v - mean) ** 2 for v in values) / (len(values) - 1))
+
+
 class MetricsCalculator:
     """Calculate all metrics from sprint data."""
     
     def __init__(self, sprint_data: List[SprintData]):
         """
         Initialize calculator with sprint data.
-        
+
         Args:
             sprint_data: List of SprintData objects to analyze.
         """
         self.sprints = sprint_data
-    
+        self._aggregates: Optional[Dict] = None
+
     def calculate_all_metrics(self) -> Dict:
         """
         Calculate all metrics at once.
-        
+
         Returns:
             Dictionary containing all calculated metrics.
         """
         if not self.sprints:
             return self._empty_metrics()
-        
+
+        counts = self.calculate_counts()
+        tasks = self.calculate_task_metrics()
+        quality = self.calculate_quality_metrics()
+
         return {
-            "counts": self.calculate_counts(),
+            "counts": counts,
             "duration": self.calculate_duration_metrics(),
-            "tasks": self.calculate_task_metrics(),
-            "quality": self.calculate_quality_metrics(),
+            "tasks": tasks,
+            "quality": quality,
             "trends": self.calculate_trends(),
-            "summary": self.calculate_summary(),
+            "summary": self._summarize(counts, tasks, quality),
         }
-    
-    def calculate_counts(self) -> Dict:
-        """Calculate sprint count metrics."""
-        total = len(self.sprints)
-        
-        status_counts = {}
+
+    def _fused_accumulate(self) -> Dict:
+        """
+        Walk the sprint list exactly once, accumulating everything the
+        per-category calculators need.
+
+        The result is cached on the instance, so the individual
+        calculate_* methods all share a single traversal.
+        """
+        if self._aggregates is not None:
+            return self._aggregates
+
+        status_counts: Dict[str, int] = {}
+        durations = []
+        min_duration = max_duration = None
+        fastest_sprint = slowest_sprint = "unknown"
+        under_3 = from_3_to_7 = over_7 = 0
+        total_tasks = completed_tasks = pending_tasks = 0
+        completed_sprint_count = 0
+        completed_sprint_tasks = completed_sprint_done = 0
+        with_planning = with_impl = with_retro = with_design = with_proposal = 0
+        retro_lengths = []
+        learnings_counts = []
+
         for sprint in self.sprints:
             status = sprint.status.lower()
             status_counts[status] = status_counts.get(status, 0) + 1
-        
+
+            duration = sprint.duration_days
+            if duration is not None and duration > 0:
+                durations.append(duration)
+                # Track extremes inline: avoids separate min()/max() passes
+                # and the float-equality lookup scan they used to feed.
+                if min_duration is None or duration < min_duration:
+                    min_duration = duration
+                    fastest_sprint = sprint.sprint_id
+                if max_duration is None or duration > max_duration:
+                    max_duration = duration
+                    slowest_sprint = sprint.sprint_id
+                if duration <= 3:
+                    under_3 += 1
+                elif duration <= 7:
+                    from_3_to_7 += 1
+                else:
+                    over_7 += 1
+
+            total_tasks += sprint.total_tasks
+            completed_tasks += sprint.completed_tasks
+            pending_tasks += sprint.pending_tasks
+
+            if sprint.is_completed:
+                completed_sprint_count += 1
+                completed_sprint_tasks += sprint.total_tasks
+                completed_sprint_done += sprint.completed_tasks
+
+            if sprint.has_planning:
+                with_planning += 1
+            if sprint.has_implementation:
+                with_impl += 1
+            if sprint.has_design:
+                with_design += 1
+            if sprint.has_proposal:
+                with_proposal += 1
+            if sprint.has_retrospective:
+                with_retro += 1
+                retro_lengths.append(sprint.retrospective_length)
+                learnings_counts.append(sprint.learnings_count)
+
+        self._aggregates = {
+            "status_counts": status_counts,
+            "durations": durations,
+            "min_duration": min_duration,
+            "max_duration": max_duration,
+            "fastest_sprint": fastest_sprint,
+            "slowest_sprint": slowest_sprint,
+            "durations_under_3_days": under_3,
+            "durations_3_to_7_days": from_3_to_7,
+            "durations_over_7_days": over_7,
+            "total_tasks": total_tasks,
+            "completed_tasks": completed_tasks,
+            "pending_tasks": pending_tasks,
+            "completed_sprint_count": completed_sprint_count,
+            "completed_sprint_tasks": completed_sprint_tasks,
+            "completed_sprint_done": completed_sprint_done,
+            "with_planning": with_planning,
+            "with_impl": with_impl,
+            "with_retro": with_retro,
+            "with_design": with_design,
+            "with_proposal": with_proposal,
+            "retro_lengths": retro_lengths,
+            "learnings_counts": learnings_counts,
+        }
+        return self._aggregates
+
+    def calculate_counts(self) -> Dict:
+        """Calculate sprint count metrics."""
+        total = len(self.sprints)
+        status_counts = self._fused_accumulate()["status_counts"]
+
         active = status_counts.get("active", 0)
         completed = status_counts.get("completed", 0)
         abandoned = status_counts.get("abandoned", 0)
         paused = status_counts.get("paused", 0)
-        
+
         return {
             "total_sprints": total,
             "active_sprints": active,
@@ -66,8 +184,9 @@ class MetricsCalculator:
     
     def calculate_duration_metrics(self) -> Dict:
         """Calculate duration analysis metrics."""
-        durations = [s.duration_days for s in self.sprints if s.duration_days is not None and s.duration_days > 0]
-        
+        agg = self._fused_accumulate()
+        durations = agg["durations"]
+
         if not durations:
             return {
                 "has_duration_data": False,
@@ -76,39 +195,42 @@ class MetricsCalculator:
                 "min_duration": 0,
                 "max_duration": 0,
             }
-        
+
+        average = statistics.fmean(durations)
+
         return {
             "has_duration_data": True,
-            "average_duration": statistics.mean(durations),
+            "average_duration": average,
             "median_duration": statistics.median(durations),
-            "min_duration": min(durations),
-            "max_duration": max(durations),
-            "std_dev": statistics.stdev(durations) if len(durations) > 1 else 0,
-            "durations_under_3_days": sum(1 for d in durations if d <= 3),
-            "durations_3_to_7_days": sum(1 for d in durations if 3 < d <= 7),
-            "durations_over_7_days": sum(1 for d in durations if d > 7),
-            "fastest_sprint": self._find_sprint_by_duration(min(durations)),
-            "slowest_sprint": self._find_sprint_by_duration(max(durations)),
+            "min_duration": agg["min_duration"],
+            "max_duration": agg["max_duration"],
+            "std_dev": _sample_stdev(durations, average) if len(durations) > 1 else 0,
+            "durations_under_3_days": agg["durations_under_3_days"],
+            "durations_3_to_7_days": agg["durations_3_to_7_days"],
+            "durations_over_7_days": agg["durations_over_7_days"],
+            "fastest_sprint": agg["fastest_sprint"],
+            "slowest_sprint": agg["slowest_sprint"],
         }
     
     def calculate_task_metrics(self) -> Dict:
         """Calculate task and productivity metrics."""
-        total_tasks = sum(s.total_tasks for s in self.sprints)
-        completed_tasks = sum(s.completed_tasks for s in self.sprints)
-        pending_tasks = sum(s.pending_tasks for s in self.sprints)
-        
+        agg = self._fused_accumulate()
+        total_tasks = agg["total_tasks"]
+        completed_tasks = agg["completed_tasks"]
+        pending_tasks = agg["pending_tasks"]
+
         # Calculate average for completed sprints only
-        completed_sprints = [s for s in self.sprints if s.is_completed]
-        
-        if completed_sprints:
-            avg_tasks = sum(s.total_tasks for s in completed_sprints) / len(completed_sprints)
-            avg_completed = sum(s.completed_tasks for s in completed_sprints) / len(completed_sprints)
+        completed_count = agg["completed_sprint_count"]
+
+        if completed_count:
+            avg_tasks = agg["completed_sprint_tasks"] / completed_count
+            avg_completed = agg["completed_sprint_done"] / completed_count
             sprint_velocity = avg_completed
         else:
             avg_tasks = 0
             avg_completed = 0
             sprint_velocity = 0
-        
+
         return {
             "total_tasks": total_tasks,
             "completed_tasks": completed_tasks,
@@ -122,21 +244,22 @@ class MetricsCalculator:
     def calculate_quality_metrics(self) -> Dict:
         """Calculate process and quality indicators."""
         total = len(self.sprints)
-        
-        with_planning = sum(1 for s in self.sprints if s.has_planning)
-        with_impl = sum(1 for s in self.sprints if s.has_implementation)
-        with_retro = sum(1 for s in self.sprints if s.has_retrospective)
-        with_design = sum(1 for s in self.sprints if s.has_design)
-        with_proposal = sum(1 for s in self.sprints if s.has_proposal)
-        
+        agg = self._fused_accumulate()
+
+        with_planning = agg["with_planning"]
+        with_impl = agg["with_impl"]
+        with_retro = agg["with_retro"]
+        with_design = agg["with_design"]
+        with_proposal = agg["with_proposal"]
+
         # Calculate average retrospective length
-        retros = [s.retrospective_length for s in self.sprints if s.has_retrospective]
-        avg_retro_length = statistics.mean(retros) if retros else 0
-        
+        retros = agg["retro_lengths"]
+        avg_retro_length = statistics.fmean(retros) if retros else 0
+
         # Calculate average learnings
-        learnings = [s.learnings_count for s in self.sprints if s.has_retrospective]
-        avg_learnings = statistics.mean(learnings) if learnings else 0
-        
+        learnings = agg["learnings_counts"]
+        avg_learnings = statistics.fmean(learnings) if learnings else 0
+
         return {
             "sprints_with_planning": with_planning,
             "sprints_with_implementation": with_impl,
@@ -158,36 +281,36 @@ class MetricsCalculator:
         
         # Sort by creation date
         sorted_sprints = sorted(self.sprints, key=lambda s: s.created_date)
-        
+        dates = [s.created_date for s in sorted_sprints]
+
         # Calculate sprints per time period
         now = datetime.now()
-        
-        # Last 7 days
-        last_7_days = sum(1 for s in sorted_sprints if (now - s.created_date).days <= 7)
-        
-        # Last 30 days
-        last_30_days = sum(1 for s in sorted_sprints if (now - s.created_date).days <= 30)
-        
-        # Last 90 days
-        last_90_days = sum(1 for s in sorted_sprints if (now - s.created_date).days <= 90)
-        
-        # Group by week
-        weeks = {}
-        for sprint in sorted_sprints:
-            week = sprint.created_date.strftime("%Y-W%U")
-            weeks[week] = weeks.get(week, 0) + 1
-        
-        # Group by month
-        months = {}
-        for sprint in sorted_sprints:
-            month = sprint.created_date.strftime("%Y-%m")
-            months[month] = months.get(month, 0) + 1
-        
-        # Calculate velocity trend
-        velocity_trend = self._calculate_velocity_trend(sorted_sprints)
-        
-        # Calculate completion rate trend
-        completion_trend = self._calculate_completion_trend(sorted_sprints)
+        total = len(dates)
+
+        # The dates are sorted, so each window count is a binary search for
+        # its cutoff instead of a full scan. (now - d).days <= N is
+        # equivalent to d > now - (N + 1) days.
+        last_7_days = total - bisect_right(dates, now - timedelta(days=8))
+        last_30_days = total - bisect_right(dates, now - timedelta(days=31))
+        last_90_days = total - bisect_right(dates, now - timedelta(days=91))
+        
+        # Group by week and month together: one strftime per sprint yields
+        # both keys, Counter does the tallying in C, and the split runs
+        # only once per unique week.
+        weeks: Dict[str, int] = {}
+        months: Dict[str, int] = {}
+        for key, count in Counter(d.strftime("%Y-W%U|%Y-%m") for d in dates).items():
+            week, month = key.split("|")
+            weeks[week] = weeks.get(week, 0) + count
+            months[month] = months.get(month, 0) + count
+        
+        # Velocity and completion-rate trends share one half-split pass
+        if len(sorted_sprints) < 4:
+            velocity_trend = completion_trend = "insufficient_data"
+        else:
+            older_vel, recent_vel, older_rate, recent_rate = self._trend_stats(sorted_sprints)
+            velocity_trend = self._trend_label(recent_vel, older_vel)
+            completion_trend = self._trend_label(recent_rate, older_rate)
         
         return {
             "has_trend_data": True,
@@ -202,15 +325,18 @@ class MetricsCalculator:
     
     def calculate_summary(self) -> Dict:
         """Calculate high-level summary metrics."""
-        counts = self.calculate_counts()
-        duration = self.calculate_duration_metrics()
-        tasks = self.calculate_task_metrics()
-        quality = self.calculate_quality_metrics()
-        
+        return self._summarize(
+            self.calculate_counts(),
+            self.calculate_task_metrics(),
+            self.calculate_quality_metrics(),
+        )
+
+    def _summarize(self, counts: Dict, tasks: Dict, quality: Dict) -> Dict:
+        """Build the summary dict from already-computed category metrics."""
         health_score = self._calculate_health_score(counts, tasks, quality)
         productivity_level = self._assess_productivity(tasks)
         process_maturity = self._assess_process_maturity(quality)
-        
+
         return {
             "health_score": health_score,
             "productivity_level": productivity_level,
@@ -221,62 +347,57 @@ class MetricsCalculator:
     # Helper methods
     
     def _empty_metrics(self) -> Dict:
-        """Return empty metrics structure."""
-        return {
-            "counts": {"total_sprints": 0},
-            "duration": {"has_duration_data": False},
-            "tasks": {"total_tasks": 0},
-            "quality": {"process_adoption_rate": 0},
-            "trends": {"has_trend_data": False},
-            "summary": {"health_score": 0, "productivity_level": "none"},
-        }
-    
-    def _find_sprint_by_duration(self, duration: float) -> str:
-        """Find sprint ID with specific duration."""
-        for sprint in self.sprints:
-            if sprint.duration_days == duration:
-                return sprint.sprint_id
-        return "unknown"
-    
-    def _calculate_velocity_trend(self, sorted_sprints: List[SprintData]) -> str:
-        """Calculate if velocity is improving, stable, or declining."""
-        if len(sorted_sprints) < 4:
-            return "insufficient_data"
-        
-        # Compare recent sprints to older ones
-        midpoint = len(sorted_sprints) // 2
-        older_sprints = sorted_sprints[:midpoint]
-        recent_sprints = sorted_sprints[midpoint:]
-        
-        older_velocity = statistics.mean([s.completed_tasks for s in older_sprints if s.completed_tasks > 0])
-        recent_velocity = statistics.mean([s.completed_tasks for s in recent_sprints if s.completed_tasks > 0])
-        
-        if recent_velocity > older_velocity * 1.1:
-            return "improving"
-        elif recent_velocity < older_velocity * 0.9:
-            return "declining"
-        else:
-            return "stable"
+        """Return a fresh copy of the empty metrics structure."""
+        return {key: dict(value) for key, value in _EMPTY_METRICS.items()}
     
-    def _calculate_completion_trend(self, sorted_sprints: List[SprintData]) -> str:
-        """Calculate if completion rate is improving."""
-        if len(sorted_sprints) < 4:
-            return "insufficient_data"
-        
+    @staticmethod
+    def _trend_stats(sorted_sprints: List[SprintData]) -> tuple:
+        """
+        Compare the older half of the date-sorted sprints to the recent half.
+
+        One loop accumulates both the velocity inputs (mean completed tasks,
+        counting only sprints that completed anything) and the completion
+        rates, so the two trend labels share a single traversal.
+
+        Returns:
+            Tuple of (older_velocity, recent_velocity, older_rate, recent_rate).
+        """
         midpoint = len(sorted_sprints) // 2
-        older_sprints = sorted_sprints[:midpoint]
-        recent_sprints = sorted_sprints[midpoint:]
-        
-        older_rate = sum(1 for s in older_sprints if s.is_completed) / len(older_sprints) * 100
-        recent_rate = sum(1 for s in recent_sprints if s.is_completed) / len(recent_sprints) * 100
-        
-        if recent_rate > older_rate * 1.1:
+        older_sum = older_n = recent_sum = recent_n = 0
+        older_done = recent_done = 0
+
+        for index, sprint in enumerate(sorted_sprints):
+            completed = sprint.completed_tasks
+            if index < midpoint:
+                if completed > 0:
+                    older_sum += completed
+                    older_n += 1
+                if sprint.is_completed:
+                    older_done += 1
+            else:
+                if completed > 0:
+                    recent_sum += completed
+                    recent_n += 1
+                if sprint.is_completed:
+                    recent_done += 1
+
+        older_velocity = older_sum / older_n if older_n else 0.0
+        recent_velocity = recent_sum / recent_n if recent_n else 0.0
+        older_rate = older_done / midpoint * 100
+        recent_rate = recent_done / (len(sorted_sprints) - midpoint) * 100
+
+        return older_velocity, recent_velocity, older_rate, recent_rate
+
+    @staticmethod
+    def _trend_label(recent: float, older: float) -> str:
+        """Classify a recent-vs-older comparison with a 10% dead band."""
+        if recent > older * 1.1:
             return "improving"
-        elif recent_rate < older_rate * 0.9:
+        elif recent < older * 0.9:
             return "declining"
         else:
             return "stable"
-    
+
     def _calculate_health_score(self, counts: Dict, tasks: Dict, quality: Dict) -> int:
         """Calculate overall project health score (0-100)."""
         score = 0
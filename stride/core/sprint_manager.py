@@ -2,7 +2,10 @@
 Logic for managing sprints (CRUD operations).
 """
 
-from typing import List, Optional
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
 from pathlib import Path
 from datetime import datetime
 from ..models import Sprint, SprintProgress, StrideTask, CheckboxItem, ImplementationLogEntry
@@ -18,6 +21,20 @@ from ..constants import (
 )
 from .markdown_parser import MarkdownParser
 
+
+@functools.lru_cache(maxsize=1024)
+def _read_text_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """Read a file, memoized on (path, mtime, size) so unchanged sprint
+    files are read and decoded once per process."""
+    return Path(path_str).read_text(encoding='utf-8')
+
+
+def _read_sprint_file(path: Path) -> str:
+    """Read a sprint file through the cache; raises OSError if absent."""
+    st = os.stat(path)
+    return _read_text_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
 class SprintManager:
     """Manager for sprint operations."""
     
@@ -25,36 +42,28 @@ class SprintManager:
         self.base_path = base_path
         self.sprints_dir = base_path / STRIDE_DIR / SPRINTS_DIR
 
-    def _determine_status(self, sprint_path: Path) -> SprintStatus:
-        if (sprint_path / FILE_RETROSPECTIVE).exists():
+    def _determine_status(self, entries: frozenset) -> SprintStatus:
+        if FILE_RETROSPECTIVE in entries:
             return SprintStatus.COMPLETED
-        if (sprint_path / FILE_IMPLEMENTATION).exists():
+        if FILE_IMPLEMENTATION in entries:
             return SprintStatus.ACTIVE
-        if (sprint_path / FILE_PLAN).exists():
-            return SprintStatus.PROPOSED
         return SprintStatus.PROPOSED
 
     def _extract_sprint_title(self, sprint_path: Path) -> str:
         """Extract sprint title from proposal.md."""
-        proposal_path = sprint_path / FILE_PROPOSAL
-        if proposal_path.exists():
-            try:
-                content = proposal_path.read_text(encoding='utf-8')
-                title = MarkdownParser.extract_title(content)
-                if title:
-                    return title
-            except Exception:
-                pass
+        try:
+            content = _read_sprint_file(sprint_path / FILE_PROPOSAL)
+            title = MarkdownParser.extract_title(content)
+            if title:
+                return title
+        except Exception:
+            pass
         return sprint_path.name
-    
+
     def _parse_acceptance_criteria(self, sprint_path: Path) -> List[CheckboxItem]:
         """Parse acceptance criteria from proposal.md."""
-        proposal_path = sprint_path / FILE_PROPOSAL
-        if not proposal_path.exists():
-            return []
-        
         try:
-            content = proposal_path.read_text(encoding='utf-8')
+            content = _read_sprint_file(sprint_path / FILE_PROPOSAL)
             section = MarkdownParser.extract_section(content, "Acceptance Criteria", level=2)
             return MarkdownParser.parse_checkboxes(section)
         except Exception:
@@ -62,12 +71,8 @@ class SprintManager:
     
     def _parse_plan_strides(self, sprint_path: Path) -> List[StrideTask]:
         """Parse strides from plan.md."""
-        plan_path = sprint_path / FILE_PLAN
-        if not plan_path.exists():
-            return []
-        
         try:
-            content = plan_path.read_text(encoding='utf-8')
+            content = _read_sprint_file(sprint_path / FILE_PLAN)
             stride_infos = MarkdownParser.parse_strides(content)
             
             # Convert to StrideTask models
@@ -88,12 +93,8 @@ class SprintManager:
     
     def _parse_implementation_logs(self, sprint_path: Path, limit: int = 5) -> List[ImplementationLogEntry]:
         """Parse recent implementation logs."""
-        impl_path = sprint_path / FILE_IMPLEMENTATION
-        if not impl_path.exists():
-            return []
-        
         try:
-            content = impl_path.read_text(encoding='utf-8')
+            content = _read_sprint_file(sprint_path / FILE_IMPLEMENTATION)
             log_infos = MarkdownParser.parse_implementation_logs(content, limit=limit)
             
             # Convert to model
@@ -108,14 +109,41 @@ class SprintManager:
         except Exception:
             return []
     
-    def _calculate_progress(self, sprint_path: Path) -> SprintProgress:
-        """Calculate overall sprint progress."""
-        strides = self._parse_plan_strides(sprint_path)
-        acceptance = self._parse_acceptance_criteria(sprint_path)
-        
-        # Calculate totals from strides
-        total_tasks = sum(stride.total_tasks for stride in strides)
-        completed_tasks = sum(stride.completed_tasks for stride in strides)
+    def _count_plan_tasks(self, sprint_path: Path) -> tuple:
+        """Count plan.md tasks without materializing StrideTask models."""
+        try:
+            content = _read_sprint_file(sprint_path / FILE_PLAN)
+        except Exception:
+            return 0, 0
+
+        total = completed = 0
+        for info in MarkdownParser.parse_strides(content):
+            total += len(info.tasks)
+            completed += sum(1 for task in info.tasks if task.checked)
+        return total, completed
+
+    def _calculate_progress(
+        self, sprint_path: Path, entries: frozenset, lite: bool = False
+    ) -> SprintProgress:
+        """
+        Calculate overall sprint progress.
+
+        With lite=True only the task counts are computed; the strides list
+        stays empty, skipping one Pydantic model per stride and checkbox.
+        """
+        if lite:
+            strides = []
+            total_tasks, completed_tasks = (
+                self._count_plan_tasks(sprint_path) if FILE_PLAN in entries else (0, 0)
+            )
+        else:
+            strides = self._parse_plan_strides(sprint_path) if FILE_PLAN in entries else []
+            total_tasks = sum(stride.total_tasks for stride in strides)
+            completed_tasks = sum(stride.completed_tasks for stride in strides)
+
+        acceptance = (
+            self._parse_acceptance_criteria(sprint_path) if FILE_PROPOSAL in entries else []
+        )
         completion_percentage = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
         
         # Calculate acceptance criteria
@@ -131,27 +159,41 @@ class SprintManager:
             acceptance_criteria_percentage=ac_percentage
         )
 
-    def get_sprint(self, sprint_id: str, include_progress: bool = False) -> Optional[Sprint]:
+    def get_sprint(
+        self, sprint_id: str, include_progress: bool = False, lite_progress: bool = False
+    ) -> Optional[Sprint]:
         """
         Retrieve a sprint by ID.
-        
+
         Args:
             sprint_id: The sprint identifier
             include_progress: Whether to parse and include progress data
+            lite_progress: With include_progress, only compute task counts
+                (no stride models, acceptance items, or recent logs)
         """
         sprint_path = self.sprints_dir / sprint_id
-        if not sprint_path.exists() or not sprint_path.is_dir():
+
+        # One scandir replaces the exists/is_dir probes plus one stat per
+        # sprint file: every downstream check reads the entry set instead.
+        try:
+            with os.scandir(sprint_path) as it:
+                entries = frozenset(entry.name for entry in it)
+            stat = os.stat(sprint_path)
+        except OSError:
+            # Missing, unreadable, or not a directory
             return None
-            
-        status = self._determine_status(sprint_path)
-        
-        # Get file stats
-        stat = sprint_path.stat()
+
+        status = self._determine_status(entries)
+
         created_at = datetime.fromtimestamp(stat.st_ctime)
         updated_at = datetime.fromtimestamp(stat.st_mtime)
-        
+
         # Extract title
-        title = self._extract_sprint_title(sprint_path)
+        title = (
+            self._extract_sprint_title(sprint_path)
+            if FILE_PROPOSAL in entries
+            else sprint_path.name
+        )
         
         # Build sprint object
         sprint = Sprint(
@@ -163,11 +205,15 @@ class SprintManager:
             updated_at=updated_at
         )
         
-        # Add progress data if requested
+        # Add progress data if requested, skipping files the scan showed
+        # to be absent
         if include_progress:
-            sprint.progress = self._calculate_progress(sprint_path)
-            sprint.acceptance_criteria = self._parse_acceptance_criteria(sprint_path)
-            sprint.recent_logs = self._parse_implementation_logs(sprint_path, limit=5)
+            sprint.progress = self._calculate_progress(sprint_path, entries, lite=lite_progress)
+            if not lite_progress:
+                if FILE_PROPOSAL in entries:
+                    sprint.acceptance_criteria = self._parse_acceptance_criteria(sprint_path)
+                if FILE_IMPLEMENTATION in entries:
+                    sprint.recent_logs = self._parse_implementation_logs(sprint_path, limit=5)
         
         return sprint
     
@@ -175,18 +221,53 @@ class SprintManager:
         """Retrieve a sprint with full details including progress."""
         return self.get_sprint(sprint_id, include_progress=True)
 
+    def iter_sprints(self, status: Optional[SprintStatus] = None) -> Iterator[Sprint]:
+        """
+        Yield sprints lazily as directories are scanned.
+
+        Unlike list_sprints, results arrive in directory order and callers
+        can stop early. With a status filter, non-matching sprints are
+        rejected from a cheap directory scan before any file is read.
+
+        Args:
+            status: Only yield sprints with this status
+        """
+        try:
+            with os.scandir(self.sprints_dir) as it:
+                sprint_ids = [entry.name for entry in it if entry.is_dir()]
+        except OSError:
+            return
+
+        for sprint_id in sprint_ids:
+            if status is not None:
+                try:
+                    with os.scandir(self.sprints_dir / sprint_id) as it:
+                        entries = frozenset(entry.name for entry in it)
+                except OSError:
+                    continue
+                if self._determine_status(entries) != status:
+                    continue
+
+            sprint = self.get_sprint(sprint_id)
+            if sprint is not None:
+                yield sprint
+
     def list_sprints(self) -> List[Sprint]:
         """List all sprints."""
-        if not self.sprints_dir.exists():
+        try:
+            with os.scandir(self.sprints_dir) as it:
+                sprint_ids = [entry.name for entry in it if entry.is_dir()]
+        except OSError:
             return []
-            
-        sprints = []
-        for item in self.sprints_dir.iterdir():
-            if item.is_dir():
-                sprint = self.get_sprint(item.name)
-                if sprint:
-                    sprints.append(sprint)
-        
+
+        if not sprint_ids:
+            return []
+
+        # get_sprint is a bundle of small stat/read calls per directory;
+        # threads overlap that I/O latency (reads release the GIL).
+        with ThreadPoolExecutor(max_workers=min(8, len(sprint_ids))) as executor:
+            sprints = [s for s in executor.map(self.get_sprint, sprint_ids) if s is not None]
+
         # Sort by creation time, newest first
         sprints.sort(key=lambda x: x.created_at, reverse=True)
         return sprints
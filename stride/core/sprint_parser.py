@@ -2,13 +2,58 @@
 Sprint parser for extracting data from sprint files.
 """
 
+import os
 import re
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict
 from ..models import SprintData
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; it
+# parses the complex-frontmatter fallback an order of magnitude faster
+# than the pure-Python scanner, with identical safe-load semantics.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Patterns compiled once at import; the parse helpers run per sprint file,
+# so per-call re-cache lookups add up when scanning large projects.
+_RE_SPRINT_NUM = re.compile(r'sprint-(\d+)')
+_RE_YAML_FM = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+_RE_DESCRIPTION = re.compile(r'^#\s+.+\n\n(.+?)(?:\n#{1,6}\s|\n---|\Z)', re.DOTALL | re.MULTILINE)
+
+# All status markers folded into one alternation so detection is a
+# single scan; the matching named group is the status.
+_RE_STATUS = re.compile(
+    r'(?P<completed>\[(?:✓|x)\].*completed|status.*completed)'
+    r'|(?P<active>\[(?:⚡|>)\].*active|status.*active|in progress)'
+    r'|(?P<paused>\[(?:⏸|//)\].*paused|status.*paused)'
+    r'|(?P<abandoned>\[(?:✗|-)\].*abandoned|status.*abandoned)',
+    re.IGNORECASE,
+)
+
+# A flat "key: value" frontmatter line with no YAML syntax that would
+# need a real parser (quoting, flow collections, block scalars, anchors,
+# comments). Anything else falls back to yaml.safe_load.
+_RE_SIMPLE_FM_LINE = re.compile(r"^([A-Za-z_][\w-]*):\s*([^\s#'\"{}\[\]|>&*][^#]*)$")
+
+# One alternation covers all created-date labels in a single scan; the
+# first labelled date in the document wins.
+_RE_CREATED_DATE = re.compile(r'(?:created|start|date)[:\s]+(\d{4}-\d{2}-\d{2})', re.IGNORECASE)
+
+# Files a sprint folder may contain, in reporting order.
+_EXPECTED_FILES = (
+    "project.md",
+    "plan.md",
+    "implementation.md",
+    "retrospective.md",
+    "design.md",
+    "proposal.md",
+)
+
 
 def scan_sprint_folders(stride_dir: Optional[Path] = None) -> List[Path]:
     """
@@ -24,23 +69,28 @@ def scan_sprint_folders(stride_dir: Optional[Path] = None) -> List[Path]:
         stride_dir = Path.cwd() / ".stride"
     
     sprints_dir = stride_dir / "sprints"
-    
-    if not sprints_dir.exists():
+
+    # Find all sprint-* folders in one scandir pass; the cached DirEntry
+    # type avoids a stat() per child, and extracting the sprint number
+    # here keeps the sort key from re-running the regex per comparison.
+    try:
+        with os.scandir(sprints_dir) as it:
+            numbered = [
+                (_extract_sprint_number(entry.name), entry.path)
+                for entry in it
+                if entry.name.startswith("sprint-") and entry.is_dir(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
         return []
-    
-    # Find all sprint-* folders
-    sprint_folders = []
-    for folder in sprints_dir.iterdir():
-        if folder.is_dir() and folder.name.startswith("sprint-"):
-            sprint_folders.append(folder)
-    
+
     # Sort by sprint number
-    return sorted(sprint_folders, key=lambda p: _extract_sprint_number(p.name))
+    numbered.sort()
+    return [Path(path) for _, path in numbered]
 
 
 def _extract_sprint_number(sprint_id: str) -> int:
     """Extract numeric part from sprint-XXX."""
-    match = re.search(r'sprint-(\d+)', sprint_id)
+    match = _RE_SPRINT_NUM.search(sprint_id)
     return int(match.group(1)) if match else 0
 
 
@@ -55,19 +105,48 @@ def parse_sprint(sprint_folder: Path) -> SprintData:
         SprintData object with all extracted information.
     """
     sprint_id = sprint_folder.name
-    
+
+    # One directory listing answers every "does this file exist" question
+    # below; the old per-file exists() probes cost a stat syscall each.
+    try:
+        with os.scandir(sprint_folder) as it:
+            present = {entry.name: entry for entry in it if entry.is_file()}
+    except OSError:
+        present = {}
+
+    # os.path.join on a plain string skips pathlib's __truediv__ parsing
+    # for every per-file path built below.
+    folder_str = str(sprint_folder)
+
+    def read_file(name: str) -> Optional[str]:
+        # The manifest already says what exists, so absent files never
+        # reach the filesystem; present ones are read exactly once.
+        if name not in present:
+            return None
+        try:
+            with open(os.path.join(folder_str, name), encoding="utf-8") as fh:
+                return fh.read()
+        except OSError:
+            return None
+
     # Parse individual files
-    project_data = _parse_project_file(sprint_folder / "project.md")
-    plan_data = _parse_plan_file(sprint_folder / "plan.md")
-    impl_data = _parse_implementation_file(sprint_folder / "implementation.md")
-    retro_data = _parse_retrospective_file(sprint_folder / "retrospective.md")
-    
-    # Check which files exist
-    files_present = []
-    for file_name in ["project.md", "plan.md", "implementation.md", "retrospective.md", "design.md", "proposal.md"]:
-        if (sprint_folder / file_name).exists():
-            files_present.append(file_name)
-    
+    project_data = _parse_project_file(
+        read_file("project.md"), os.path.join(folder_str, "project.md")
+    )
+    plan_data = _parse_plan_file(read_file("plan.md"))
+    retro_data = _parse_retrospective_file(read_file("retrospective.md"))
+
+    # Only the length of implementation.md is ever needed, and the
+    # scandir entry's stat answers that without reading (and decoding)
+    # a potentially large log file.
+    impl_entry = present.get("implementation.md")
+    impl_data = {
+        "has_implementation": impl_entry is not None,
+        "implementation_length": impl_entry.stat().st_size if impl_entry is not None else 0,
+    }
+
+    files_present = [name for name in _EXPECTED_FILES if name in present]
+
     # Calculate duration
     duration_days = None
     if project_data.get("created_date") and project_data.get("completed_date"):
@@ -91,11 +170,11 @@ def parse_sprint(sprint_folder: Path) -> SprintData:
         completed_tasks=completed_tasks,
         pending_tasks=plan_data.get("pending_tasks", 0),
         task_completion_rate=task_completion_rate,
-        has_planning=(sprint_folder / "plan.md").exists(),
-        has_implementation=(sprint_folder / "implementation.md").exists(),
-        has_retrospective=(sprint_folder / "retrospective.md").exists(),
-        has_design=(sprint_folder / "design.md").exists(),
-        has_proposal=(sprint_folder / "proposal.md").exists(),
+        has_planning="plan.md" in present,
+        has_implementation="implementation.md" in present,
+        has_retrospective="retrospective.md" in present,
+        has_design="design.md" in present,
+        has_proposal="proposal.md" in present,
         retrospective_length=retro_data.get("retrospective_length", 0),
         learnings_count=retro_data.get("learnings_count", 0),
         folder_path=sprint_folder,
@@ -103,28 +182,50 @@ def parse_sprint(sprint_folder: Path) -> SprintData:
     )
 
 
-def _parse_project_file(file_path: Path) -> Dict:
+def _parse_frontmatter(frontmatter: str) -> Optional[Dict]:
+    """
+    Parse flat key/value frontmatter without spinning up PyYAML.
+
+    Sprint frontmatter is almost always a handful of simple scalar lines,
+    for which the full YAML parser/composer is an order of magnitude
+    slower than a split per line. Returns None when any line needs real
+    YAML semantics, signalling the caller to fall back to yaml.safe_load.
+    """
+    data = {}
+    for line in frontmatter.splitlines():
+        if not line.strip():
+            continue
+        match = _RE_SIMPLE_FM_LINE.match(line)
+        if match is None:
+            return None
+        data[match.group(1)] = match.group(2).strip()
+    return data
+
+
+def _parse_project_file(content: Optional[str], file_path: str) -> Dict:
     """
     Extract metadata from project.md.
-    
+
     Args:
-        file_path: Path to project.md
-        
+        content: Content of project.md, or None if the file is absent.
+        file_path: Path to project.md (for the mtime fallback).
+
     Returns:
         Dictionary with extracted data.
     """
-    if not file_path.exists():
+    if content is None:
         return {}
-    
-    content = file_path.read_text(encoding="utf-8")
     data = {}
     
-    # Try YAML frontmatter first
-    if content.startswith("---"):
-        yaml_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
+    # Try YAML frontmatter first; the startswith check keeps files
+    # without a frontmatter fence away from the DOTALL regex.
+    if content.startswith("---\n"):
+        yaml_match = _RE_YAML_FM.match(content)
         if yaml_match:
             try:
-                frontmatter = yaml.safe_load(yaml_match.group(1))
+                frontmatter = _parse_frontmatter(yaml_match.group(1))
+                if frontmatter is None:
+                    frontmatter = yaml.load(yaml_match.group(1), Loader=_YamlLoader)
                 if frontmatter:
                     data.update(frontmatter)
                     
@@ -145,79 +246,78 @@ def _parse_project_file(file_path: Path) -> Dict:
             except:
                 pass
     
-    # Extract title from first heading
+    # Extract title from first heading; a startswith scan over pre-chopped
+    # lines beats a multiline regex for this single-line shape.
     if "title" not in data:
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-        if title_match:
-            data["title"] = title_match.group(1).strip()
+        for line in content.splitlines():
+            if line.startswith("#") and len(line) > 1 and line[1] in " \t":
+                title = line[1:].strip()
+                if title:
+                    data["title"] = title
+                    break
     
     # Extract description (text after first heading, before next heading)
     if "description" not in data:
-        desc_match = re.search(r'^#\s+.+\n\n(.+?)(?:\n#{1,6}\s|\n---|\Z)', content, re.DOTALL | re.MULTILINE)
+        desc_match = _RE_DESCRIPTION.search(content)
         if desc_match:
             data["description"] = desc_match.group(1).strip()[:200]  # First 200 chars
     
     # Detect status from content
     if "status" not in data:
-        status_patterns = {
-            "completed": [r'\[✓\].*completed', r'\[x\].*completed', r'status.*completed'],
-            "active": [r'\[⚡\].*active', r'\[>\].*active', r'status.*active', r'in progress'],
-            "paused": [r'\[⏸\].*paused', r'\[//\].*paused', r'status.*paused'],
-            "abandoned": [r'\[✗\].*abandoned', r'\[-\].*abandoned', r'status.*abandoned'],
-        }
-        
-        for status, patterns in status_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    data["status"] = status
-                    break
-            if "status" in data:
-                break
+        status_match = _RE_STATUS.search(content)
+        if status_match:
+            data["status"] = status_match.lastgroup
     
     # Extract dates from content if not in frontmatter
     if "created_date" not in data:
-        date_patterns = [
-            r'created[:\s]+(\d{4}-\d{2}-\d{2})',
-            r'start[:\s]+(\d{4}-\d{2}-\d{2})',
-            r'date[:\s]+(\d{4}-\d{2}-\d{2})',
-        ]
-        for pattern in date_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                try:
-                    data["created_date"] = datetime.strptime(match.group(1), '%Y-%m-%d')
-                    break
-                except:
-                    pass
+        match = _RE_CREATED_DATE.search(content)
+        if match:
+            try:
+                # fromisoformat is C-level; strptime drags in _strptime
+                # and locale machinery for the same YYYY-MM-DD shape.
+                data["created_date"] = datetime.fromisoformat(match.group(1))
+            except ValueError:
+                pass
     
     # Fallback to file modification time
     if "created_date" not in data:
-        data["created_date"] = datetime.fromtimestamp(file_path.stat().st_mtime)
+        data["created_date"] = datetime.fromtimestamp(os.stat(file_path).st_mtime)
     
     return data
 
 
-def _parse_plan_file(file_path: Path) -> Dict:
+def _parse_plan_file(content: Optional[str]) -> Dict:
     """
     Extract task data from plan.md.
-    
+
     Args:
-        file_path: Path to plan.md
-        
+        content: Content of plan.md, or None if the file is absent.
+
     Returns:
         Dictionary with task counts and completion rate.
     """
-    if not file_path.exists():
+    if content is None or "[" not in content:
+        # A plan without a single bracket has no task markers; the
+        # substring test is a native memmem scan, far cheaper than the
+        # line loop below.
         return {"total_tasks": 0, "completed_tasks": 0, "pending_tasks": 0}
-    
-    content = file_path.read_text(encoding="utf-8")
-    
+
+
     # Find all task markers
     # Patterns: - [ ] task, - [x] task, - [X] task, * [ ] task, etc.
-    all_tasks = re.findall(r'^[\s]*[-*]\s*\[(.)\]', content, re.MULTILINE)
-    
-    total_tasks = len(all_tasks)
-    completed_tasks = sum(1 for mark in all_tasks if mark.lower() == 'x')
+    # Counting with C-level str methods per line skips the regex engine
+    # and the intermediate list of marker characters entirely.
+    total_tasks = 0
+    completed_tasks = 0
+    for line in content.splitlines():
+        stripped = line.lstrip()
+        if not stripped or stripped[0] not in "-*":
+            continue
+        rest = stripped[1:].lstrip()
+        if len(rest) >= 3 and rest[0] == "[" and rest[2] == "]":
+            total_tasks += 1
+            if rest[1] in "xX":
+                completed_tasks += 1
     pending_tasks = total_tasks - completed_tasks
     
     return {
@@ -227,52 +327,42 @@ def _parse_plan_file(file_path: Path) -> Dict:
     }
 
 
-def _parse_implementation_file(file_path: Path) -> Dict:
-    """
-    Extract implementation data.
-    
-    Args:
-        file_path: Path to implementation.md
-        
-    Returns:
-        Dictionary with implementation status.
-    """
-    if not file_path.exists():
-        return {"has_implementation": False}
-    
-    content = file_path.read_text(encoding="utf-8")
-    
-    return {
-        "has_implementation": True,
-        "implementation_length": len(content),
-    }
-
-
-def _parse_retrospective_file(file_path: Path) -> Dict:
+def _parse_retrospective_file(content: Optional[str]) -> Dict:
     """
     Extract learnings from retrospective.md.
-    
+
     Args:
-        file_path: Path to retrospective.md
-        
+        content: Content of retrospective.md, or None if the file is absent.
+
     Returns:
         Dictionary with retrospective data.
     """
-    if not file_path.exists():
+    if content is None:
         return {
             "has_retrospective": False,
             "retrospective_length": 0,
             "learnings_count": 0,
         }
-    
-    content = file_path.read_text(encoding="utf-8")
-    
+
+
     # Count words (basic quality indicator)
     word_count = len(content.split())
-    
-    # Extract sections - count bullet points as learnings
-    learnings = re.findall(r'^[\s]*[-*]\s+(.+)$', content, re.MULTILINE)
-    learnings_count = len(learnings)
+
+    # Extract sections - count bullet lines as learnings; skip the line
+    # walk when no bullet character appears at all. Each line is tested
+    # with C-level str primitives rather than the regex engine.
+    learnings_count = 0
+    if "-" in content or "*" in content:
+        for line in content.splitlines():
+            stripped = line.lstrip()
+            if (
+                stripped
+                and stripped[0] in "-*"
+                and len(stripped) > 1
+                and stripped[1] in " \t"
+                and stripped[1:].strip()
+            ):
+                learnings_count += 1
     
     return {
         "has_retrospective": True,
@@ -292,4 +382,11 @@ def parse_all_sprints(stride_dir: Optional[Path] = None) -> List[SprintData]:
         List of SprintData objects.
     """
     sprint_folders = scan_sprint_folders(stride_dir)
-    return [parse_sprint(folder) for folder in sprint_folders]
+    if not sprint_folders:
+        return []
+
+    # parse_sprint is dominated by stat/read syscalls which release the
+    # GIL, so a small thread pool overlaps the per-sprint disk latency.
+    # map preserves folder order, so results stay sorted by sprint number.
+    with ThreadPoolExecutor(max_workers=min(8, len(sprint_folders))) as executor:
+        return list(executor.map(parse_sprint, sprint_folders))
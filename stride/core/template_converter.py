@@ -13,8 +13,16 @@ Supports 9 different format types across 19 AI coding assistants:
 9. no-frontmatter: KiloCode
 """
 
+import functools
 import re
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+
+@functools.lru_cache(maxsize=128)
+def _escape_toml_body(body: str) -> str:
+    """Escape triple quotes for TOML prompts; cached because several
+    agents share the toml format and feed it identical bodies."""
+    return body.replace('"""', r'\"\"\"')
 
 
 class TemplateConverter:
@@ -26,6 +34,42 @@ class TemplateConverter:
     STRIDE_START = "<!-- STRIDE:START -->"
     STRIDE_END = "<!-- STRIDE:END -->"
 
+    # Extraction patterns compiled once at class load; every template
+    # conversion reuses them instead of re-submitting pattern literals
+    # to the re module.
+    DESCRIPTION_PATTERN = re.compile(
+        r'^---\s*\ndescription:\s*(.+?)\s*\n---', re.MULTILINE | re.DOTALL
+    )
+
+    # Per-command context lines for the XML-tag formats, hoisted so the
+    # converters don't rebuild a ten-entry dict per call (stride init
+    # converts every command for every configured agent).
+    AMAZONQ_CONTEXT = {
+        "init": "The user wants to initialize or validate their Stride project context.",
+        "derive": "The user wants to derive sprint details from an existing proposal.",
+        "lite": "The user wants to create a lightweight sprint without full planning.",
+        "plan": "The user wants to create a detailed sprint plan.",
+        "present": "The user wants to present the sprint plan for review.",
+        "implement": "The user wants to implement the sprint plan.",
+        "feedback": "The user wants to provide feedback on sprint progress.",
+        "review": "The user wants to review sprint implementation.",
+        "complete": "The user wants to mark the sprint as complete.",
+        "status": "The user wants to check sprint status.",
+    }
+
+    OPENCODE_CONTEXT = {
+        "init": "The user wants to initialize their Stride project. Use the stride instructions below.",
+        "derive": "The user wants to derive sprint details from an existing proposal. Find the proposal and follow the instructions below.",
+        "lite": "The user wants to create a lightweight sprint. Follow the stride instructions below.",
+        "plan": "The user wants to create a detailed sprint plan. Follow the stride instructions below.",
+        "present": "The user wants to present the sprint plan. Follow the stride instructions below.",
+        "implement": "The user wants to implement the sprint. Follow the stride instructions below. If you're not sure or if ambiguous, ask for clarification from the user.",
+        "feedback": "The user wants to provide sprint feedback. Follow the stride instructions below.",
+        "review": "The user wants to review the sprint. Follow the stride instructions below.",
+        "complete": "The user wants to complete the sprint. Follow the stride instructions below.",
+        "status": "The user wants to check sprint status. Follow the stride instructions below.",
+    }
+
     # Command display names mapping
     COMMAND_NAMES = {
         "init": "Init",
@@ -61,41 +105,22 @@ class TemplateConverter:
             Converted content in target format
         """
         # Extract parts from original content
-        description = cls._extract_description(content)
-        body = cls._extract_body(content)
-
-        # Convert based on format type
-        if format_type == "yaml-rich-metadata":
-            return cls._convert_yaml_rich_metadata(command_name, description, body)
-        elif format_type == "yaml-name-id":
-            return cls._convert_yaml_name_id(command_name, description, body)
-        elif format_type == "yaml-arguments":
-            if agent_key == "factory":
-                return cls._convert_yaml_arguments_factory(description, body)
-            else:
-                return cls._convert_yaml_arguments(description, body)
-        elif format_type == "yaml-xml-tags":
-            if agent_key == "opencode":
-                return cls._convert_yaml_xml_tags_opencode(command_name, description, body)
-            else:
-                return cls._convert_yaml_xml_tags_amazonq(command_name, description, body)
-        elif format_type == "yaml-auto-exec":
-            return cls._convert_yaml_auto_exec(description, body)
-        elif format_type == "yaml-github-copilot":
-            return cls._convert_yaml_github_copilot(description, body)
-        elif format_type == "toml":
-            return cls._convert_toml(description, body)
-        elif format_type == "markdown-heading":
-            return cls._convert_markdown_heading(command_name, description, body)
-        elif format_type == "no-frontmatter":
-            return cls._convert_no_frontmatter(body)
-        else:  # yaml-basic (default)
+        description, body = _template_parts(content)
+
+        # Dispatch on format type: agent-specific overrides first, then
+        # the format's default converter; unknown formats (yaml-basic)
+        # pass the content through unchanged.
+        converter = cls._AGENT_CONVERTERS.get((format_type, agent_key)) or cls._CONVERTERS.get(
+            format_type
+        )
+        if converter is None:
             return content
+        return converter(command_name, description, body)
 
     @classmethod
     def _extract_description(cls, content: str) -> str:
         """Extract description from YAML frontmatter."""
-        match = re.search(r'^---\s*\ndescription:\s*(.+?)\s*\n---', content, re.MULTILINE | re.DOTALL)
+        match = cls.DESCRIPTION_PATTERN.search(content)
         if match:
             return match.group(1).strip()
         return "Stride command"
@@ -114,12 +139,21 @@ class TemplateConverter:
             body = content[start_idx + len(start_marker):end_idx].strip()
             return body
         
-        # Fallback: extract everything after frontmatter and $ARGUMENTS
-        # Remove YAML frontmatter
-        content_without_yaml = re.sub(r'^---\s*\n.*?\n---\s*\n', '', content, flags=re.MULTILINE | re.DOTALL)
-        # Remove $ARGUMENTS line
-        content_without_args = re.sub(r'^\$ARGUMENTS\s*\n', '', content_without_yaml, flags=re.MULTILINE)
-        return content_without_args.strip()
+        # Fallback: extract everything after frontmatter and $ARGUMENTS,
+        # using partition/startswith (C-level substring search) rather
+        # than DOTALL regex substitutions over the whole template.
+        body = content
+        if body.startswith("---"):
+            _, sep, rest = body[3:].partition("\n---")
+            if sep:
+                # Skip the remainder of the closing fence line
+                newline_idx = rest.find("\n")
+                body = rest[newline_idx + 1:] if newline_idx != -1 else ""
+
+        body = body.lstrip()
+        if body.startswith("$ARGUMENTS"):
+            body = body[len("$ARGUMENTS"):]
+        return body.strip()
 
     @classmethod
     def _convert_yaml_rich_metadata(cls, command_name: str, description: str, body: str) -> str:
@@ -160,7 +194,7 @@ description: {description}
 """
 
     @classmethod
-    def _convert_yaml_arguments(cls, description: str, body: str) -> str:
+    def _convert_yaml_arguments(cls, command_name: str, description: str, body: str) -> str:
         """
         Format Type 3: YAML with argument-hint.
         Used by: Codex, Auggie
@@ -178,7 +212,7 @@ $ARGUMENTS
 """
 
     @classmethod
-    def _convert_yaml_arguments_factory(cls, description: str, body: str) -> str:
+    def _convert_yaml_arguments_factory(cls, command_name: str, description: str, body: str) -> str:
         """
         Format Type 3b: YAML with $ARGUMENTS at END of body.
         Used by: Factory Droid
@@ -201,20 +235,9 @@ $ARGUMENTS
         Format Type 4a: YAML with XML-tagged arguments.
         Used by: Amazon Q
         """
-        context_map = {
-            "init": "The user wants to initialize or validate their Stride project context.",
-            "derive": "The user wants to derive sprint details from an existing proposal.",
-            "lite": "The user wants to create a lightweight sprint without full planning.",
-            "plan": "The user wants to create a detailed sprint plan.",
-            "present": "The user wants to present the sprint plan for review.",
-            "implement": "The user wants to implement the sprint plan.",
-            "feedback": "The user wants to provide feedback on sprint progress.",
-            "review": "The user wants to review sprint implementation.",
-            "complete": "The user wants to mark the sprint as complete.",
-            "status": "The user wants to check sprint status.",
-        }
-        
-        context = context_map.get(command_name, f"The user wants to execute the {command_name} command.")
+        context = cls.AMAZONQ_CONTEXT.get(
+            command_name, f"The user wants to execute the {command_name} command."
+        )
         
         return f"""---
 description: {description}
@@ -237,20 +260,10 @@ description: {description}
         Format Type 4b: YAML with rich context and XML-tagged arguments.
         Used by: OpenCode
         """
-        context_map = {
-            "init": "The user wants to initialize their Stride project. Use the stride instructions below.",
-            "derive": "The user wants to derive sprint details from an existing proposal. Find the proposal and follow the instructions below.",
-            "lite": "The user wants to create a lightweight sprint. Follow the stride instructions below.",
-            "plan": "The user wants to create a detailed sprint plan. Follow the stride instructions below.",
-            "present": "The user wants to present the sprint plan. Follow the stride instructions below.",
-            "implement": "The user wants to implement the sprint. Follow the stride instructions below. If you're not sure or if ambiguous, ask for clarification from the user.",
-            "feedback": "The user wants to provide sprint feedback. Follow the stride instructions below.",
-            "review": "The user wants to review the sprint. Follow the stride instructions below.",
-            "complete": "The user wants to complete the sprint. Follow the stride instructions below.",
-            "status": "The user wants to check sprint status. Follow the stride instructions below.",
-        }
-        
-        context = context_map.get(command_name, f"The user wants to execute the {command_name} stride command. Follow the instructions below.")
+        context = cls.OPENCODE_CONTEXT.get(
+            command_name,
+            f"The user wants to execute the {command_name} stride command. Follow the instructions below.",
+        )
         
         return f"""---
 description: {description}
@@ -268,7 +281,7 @@ description: {description}
 """
 
     @classmethod
-    def _convert_yaml_auto_exec(cls, description: str, body: str) -> str:
+    def _convert_yaml_auto_exec(cls, command_name: str, description: str, body: str) -> str:
         """
         Format Type 5: YAML with auto_execution_mode.
         Used by: Windsurf
@@ -284,7 +297,7 @@ auto_execution_mode: 3
 """
 
     @classmethod
-    def _convert_yaml_github_copilot(cls, description: str, body: str) -> str:
+    def _convert_yaml_github_copilot(cls, command_name: str, description: str, body: str) -> str:
         """
         Format Type 6: GitHub Copilot format with $ARGUMENTS.
         Used by: GitHub Copilot
@@ -301,13 +314,13 @@ $ARGUMENTS
 """
 
     @classmethod
-    def _convert_toml(cls, description: str, body: str) -> str:
+    def _convert_toml(cls, command_name: str, description: str, body: str) -> str:
         """
         Format Type 7: TOML format with triple-quoted prompt.
         Used by: Qwen, Gemini, Codex
         """
         # Escape any triple quotes in the body
-        body_escaped = body.replace('"""', r'\"\"\"')
+        body_escaped = _escape_toml_body(body)
         
         return f"""description = "{description}"
 
@@ -336,7 +349,7 @@ prompt = \"\"\"
 """
 
     @classmethod
-    def _convert_no_frontmatter(cls, body: str) -> str:
+    def _convert_no_frontmatter(cls, command_name: str, description: str, body: str) -> str:
         """
         Format Type 9: No frontmatter, just content.
         Used by: KiloCode
@@ -345,3 +358,41 @@ prompt = \"\"\"
 {body}
 {cls.STRIDE_END}
 """
+
+
+@functools.lru_cache(maxsize=64)
+def _template_parts(content: str) -> Tuple[str, str]:
+    """
+    Return (description, body) for a base template.
+
+    stride init converts the same base template once per configured
+    agent, so the extraction work is cached on the content string and
+    paid only for the first format.
+    """
+    return (
+        TemplateConverter._extract_description(content),
+        TemplateConverter._extract_body(content),
+    )
+
+
+# Dispatch tables built after the class body so entries are bound
+# classmethods sharing the uniform (command_name, description, body)
+# signature; converters that don't need a field simply ignore it.
+TemplateConverter._CONVERTERS = {
+    "yaml-rich-metadata": TemplateConverter._convert_yaml_rich_metadata,
+    "yaml-name-id": TemplateConverter._convert_yaml_name_id,
+    "yaml-arguments": TemplateConverter._convert_yaml_arguments,
+    "yaml-xml-tags": TemplateConverter._convert_yaml_xml_tags_amazonq,
+    "yaml-auto-exec": TemplateConverter._convert_yaml_auto_exec,
+    "yaml-github-copilot": TemplateConverter._convert_yaml_github_copilot,
+    "toml": TemplateConverter._convert_toml,
+    "markdown-heading": TemplateConverter._convert_markdown_heading,
+    "no-frontmatter": TemplateConverter._convert_no_frontmatter,
+}
+
+# (format_type, agent_key) pairs whose output deviates from the
+# format's default converter.
+TemplateConverter._AGENT_CONVERTERS = {
+    ("yaml-arguments", "factory"): TemplateConverter._convert_yaml_arguments_factory,
+    ("yaml-xml-tags", "opencode"): TemplateConverter._convert_yaml_xml_tags_opencode,
+}
@@ -5,22 +5,109 @@ Provides utilities for getting user information, greetings, and motivational mes
 
 import random
 import datetime
+import time
 from typing import Optional, Dict
 
+# Cached auth lookup: every message helper asks for the username, and a
+# single CLI command can do so several times. The underlying lookup
+# instantiates SupabaseAuth and touches stored credentials, so the
+# result is held for a short TTL instead of refetched per call.
+_USER_CACHE: Optional[Dict[str, str]] = None
+_USER_CACHE_TIME: float = 0.0
+_USER_CACHE_TTL = 60.0
+
+# Message pools hoisted to module level so each call formats only the
+# one selected template instead of interpolating every candidate into a
+# fresh list.
+_WELCOME_RETURNING = (
+    "Welcome back, {username}!",
+    "Great to see you again, {username}!",
+    "Ready to sprint, {username}?",
+)
+_WELCOME_NEW = (
+    "Welcome to Stride, {username}!",
+    "Let's get started, {username}!",
+    "Ready to build something amazing, {username}?",
+)
+
+_MOTIVATIONAL_MESSAGES = {
+    "init": (
+        "Let's build something amazing!",
+        "Time to create magic!",
+        "Your next great sprint awaits!",
+    ),
+    "status": (
+        "You're doing great!",
+        "Keep up the momentum!",
+        "You're making excellent progress!",
+    ),
+    "progress_high": (
+        "You're crushing it!",
+        "Almost there!",
+        "Great progress!",
+    ),
+    "progress_low": (
+        "Every step counts!",
+        "Keep going!",
+        "You've got this!",
+    ),
+    "complete": (
+        "Excellent work!",
+        "You're crushing it!",
+        "Outstanding achievement!",
+    ),
+    "validate_success": (
+        "Perfect work!",
+        "Looking great!",
+        "Everything checks out!",
+    ),
+    "validate_error": (
+        "No worries, here's what needs fixing:",
+        "Small tweaks needed:",
+        "Let's get these sorted:",
+    ),
+    "metrics": (
+        "Keep up the momentum!",
+        "You're on fire!",
+        "Impressive stats!",
+    ),
+}
+_MOTIVATIONAL_DEFAULT = ("Keep going!",)
+
 
 def get_current_user() -> Optional[Dict[str, str]]:
     """
     Get currently authenticated user information.
-    
+
+    The result is cached for a short TTL; call clear_user_cache() after
+    login/logout to force a fresh lookup.
+
     Returns:
         Dict with 'email', 'username', 'token' if authenticated, None otherwise
     """
+    global _USER_CACHE, _USER_CACHE_TIME
+
+    now = time.monotonic()
+    if _USER_CACHE_TIME and now - _USER_CACHE_TIME < _USER_CACHE_TTL:
+        return _USER_CACHE
+
     try:
         from .auth import SupabaseAuth
         auth = SupabaseAuth()
-        return auth.get_current_user()
+        user = auth.get_current_user()
     except Exception:
-        return None
+        user = None
+
+    _USER_CACHE = user
+    _USER_CACHE_TIME = now
+    return user
+
+
+def clear_user_cache() -> None:
+    """Drop the cached user so the next lookup hits the auth backend."""
+    global _USER_CACHE, _USER_CACHE_TIME
+    _USER_CACHE = None
+    _USER_CACHE_TIME = 0.0
 
 
 def get_username_display() -> str:
@@ -89,21 +176,9 @@ def get_welcome_message(is_returning: bool = True) -> str:
         Welcome message string
     """
     username = get_username_display()
-    
-    if is_returning:
-        messages = [
-            f"Welcome back, {username}!",
-            f"Great to see you again, {username}!",
-            f"Ready to sprint, {username}?",
-        ]
-    else:
-        messages = [
-            f"Welcome to Stride, {username}!",
-            f"Let's get started, {username}!",
-            f"Ready to build something amazing, {username}?",
-        ]
-    
-    return random.choice(messages)
+
+    messages = _WELCOME_RETURNING if is_returning else _WELCOME_NEW
+    return random.choice(messages).format(username=username)
 
 
 def get_motivational_message(context: str = "general") -> str:
@@ -116,50 +191,7 @@ def get_motivational_message(context: str = "general") -> str:
     Returns:
         Motivational message string
     """
-    messages = {
-        "init": [
-            "Let's build something amazing!",
-            "Time to create magic!",
-            "Your next great sprint awaits!",
-        ],
-        "status": [
-            "You're doing great!",
-            "Keep up the momentum!",
-            "You're making excellent progress!",
-        ],
-        "progress_high": [
-            "You're crushing it!",
-            "Almost there!",
-            "Great progress!",
-        ],
-        "progress_low": [
-            "Every step counts!",
-            "Keep going!",
-            "You've got this!",
-        ],
-        "complete": [
-            "Excellent work!",
-            "You're crushing it!",
-            "Outstanding achievement!",
-        ],
-        "validate_success": [
-            "Perfect work!",
-            "Looking great!",
-            "Everything checks out!",
-        ],
-        "validate_error": [
-            "No worries, here's what needs fixing:",
-            "Small tweaks needed:",
-            "Let's get these sorted:",
-        ],
-        "metrics": [
-            "Keep up the momentum!",
-            "You're on fire!",
-            "Impressive stats!",
-        ],
-    }
-    
-    return random.choice(messages.get(context, ["Keep going!"]))
+    return random.choice(_MOTIVATIONAL_MESSAGES.get(context, _MOTIVATIONAL_DEFAULT))
 
 
 def get_progress_encouragement(completed: int, total: int) -> str:
@@ -3,6 +3,7 @@ Pydantic data models for Stride entities.
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import List, Optional
 from pathlib import Path
 from dataclasses import dataclass
@@ -25,9 +26,14 @@ class StrideTask(BaseModel):
     tasks: List[CheckboxItem] = Field(default_factory=list)
     completion_definition: str = ""
     
-    @property
+    @cached_property
     def completed_tasks(self) -> int:
-        """Count of completed tasks."""
+        """Count of completed tasks.
+
+        Cached: progress aggregation and current-stride lookup both read
+        this, and the task list is built once from the parser and never
+        mutated afterwards.
+        """
         return sum(1 for task in self.tasks if task.checked)
     
     @property
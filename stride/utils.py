@@ -2,10 +2,61 @@
 Helper utilities for Stride CLI.
 """
 
+import bisect
 import uuid
 from datetime import datetime
-from typing import List
-from rich.text import Text
+from typing import TYPE_CHECKING, List, Optional
+
+from .constants import (
+    COLOR_ACTIVE,
+    COLOR_COMPLETED,
+    COLOR_PROPOSED,
+    COLOR_REVIEW,
+    SprintStatus,
+)
+
+if TYPE_CHECKING:
+    from rich.text import Text
+
+# Status value -> full Rich markup, replacing a per-call import plus
+# if/elif chain and f-string build in colorize_status
+_FORMATTED_STATUS = {
+    status.value: f"[{color}]{status.value.upper()}[/{color}]"
+    for status, color in (
+        (SprintStatus.PROPOSED, COLOR_PROPOSED),
+        (SprintStatus.ACTIVE, COLOR_ACTIVE),
+        (SprintStatus.REVIEW, COLOR_REVIEW),
+        (SprintStatus.COMPLETED, COLOR_COMPLETED),
+    )
+}
+
+# Checkbox markup indexed by the checked flag
+_CHECKBOX = ("[dim]○[/dim]", "[green]✓[/green]")
+
+# Coarse clock for relative timestamps: a table render calls
+# format_timestamp_relative once per row, and each datetime.now() is a
+# clock_gettime syscall. The CLI callback pins "now" once per command;
+# library callers without that context still get a live clock.
+_cached_now: Optional[datetime] = None
+
+# Max-width bar segments sliced per render: slicing a prebuilt string
+# is one allocation versus two str.__mul__ builds per progress row.
+_BAR_MAX_WIDTH = 64
+_FULL_BAR = "█" * _BAR_MAX_WIDTH
+_EMPTY_BAR = "░" * _BAR_MAX_WIDTH
+
+# Parallel relative-time bucket tables; bisect picks the bucket for a
+# given age in one C-level binary search
+_TIME_THRESHOLDS = (3600, 86400, 604800)
+_TIME_DIVISORS = (60, 3600, 86400)
+_TIME_UNITS = ("minute", "hour", "day")
+
+
+def set_now_context() -> None:
+    """Pin the reference clock used by format_timestamp_relative for the
+    duration of the current CLI command."""
+    global _cached_now
+    _cached_now = datetime.now()
 
 
 def generate_sprint_id() -> str:
@@ -36,27 +87,35 @@ def render_progress_bar(percentage: float, width: int = 20, show_percentage: boo
         Formatted progress bar string
     """
     filled = int(width * percentage / 100)
-    empty = width - filled
-    bar = "█" * filled + "░" * empty
-    
+    if width <= _BAR_MAX_WIDTH:
+        bar = f"{_FULL_BAR[:filled]}{_EMPTY_BAR[:width - filled]}"
+    else:
+        bar = "█" * filled + "░" * (width - filled)
+
     if show_percentage:
         return f"{bar} {percentage:.0f}%"
     return bar
 
 
-def create_progress_text(completed: int, total: int, show_bar: bool = True, bar_width: int = 15) -> Text:
+def create_progress_text(
+    completed: int, total: int, show_bar: bool = True, bar_width: int = 15
+) -> "Text":
     """
     Create a Rich Text object with progress information.
-    
+
     Args:
         completed: Number of completed items
         total: Total number of items
         show_bar: Whether to include a progress bar
         bar_width: Width of the progress bar
-        
+
     Returns:
         Rich Text object
     """
+    # Deferred so importing utils (e.g. for get_timestamp at CLI
+    # startup) doesn't pay the rich.text import
+    from rich.text import Text
+
     if total == 0:
         percentage = 0.0
     else:
@@ -76,8 +135,12 @@ def create_progress_text(completed: int, total: int, show_bar: bool = True, bar_
         else:
             bar_color = "red"
         
-        text.append("█" * filled, style=bar_color)
-        text.append("░" * empty, style="dim")
+        if bar_width <= _BAR_MAX_WIDTH:
+            text.append(_FULL_BAR[:filled], style=bar_color)
+            text.append(_EMPTY_BAR[:empty], style="dim")
+        else:
+            text.append("█" * filled, style=bar_color)
+            text.append("░" * empty, style="dim")
         text.append(" ")
     
     text.append(f"{completed}/{total}", style="bold")
@@ -95,24 +158,16 @@ def format_timestamp_relative(dt: datetime) -> str:
     Returns:
         Relative time string
     """
-    now = datetime.now()
-    diff = now - dt
-    
-    seconds = diff.total_seconds()
-    
+    now = _cached_now or datetime.now()
+    seconds = (now - dt).total_seconds()
+
     if seconds < 60:
         return "just now"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif seconds < 86400:
-        hours = int(seconds / 3600)
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif seconds < 604800:
-        days = int(seconds / 86400)
-        return f"{days} day{'s' if days != 1 else ''} ago"
-    else:
+    i = bisect.bisect_right(_TIME_THRESHOLDS, seconds)
+    if i == len(_TIME_THRESHOLDS):
         return dt.strftime("%Y-%m-%d")
+    n = int(seconds / _TIME_DIVISORS[i])
+    return f"{n} {_TIME_UNITS[i]}{'s' if n != 1 else ''} ago"
 
 
 def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
@@ -142,7 +197,7 @@ def format_checkbox(checked: bool) -> str:
     Returns:
         Formatted checkbox string
     """
-    return "[green]✓[/green]" if checked else "[dim]○[/dim]"
+    return _CHECKBOX[checked]
 
 
 def format_task_list(tasks: List, max_display: int = 5) -> List[str]:
@@ -179,17 +234,7 @@ def colorize_status(status: str) -> str:
     Returns:
         Colored status string
     """
-    from .constants import SprintStatus, COLOR_PROPOSED, COLOR_ACTIVE, COLOR_REVIEW, COLOR_COMPLETED
-    
-    status_lower = status.lower()
-    
-    if status_lower == SprintStatus.PROPOSED.value:
-        return f"[{COLOR_PROPOSED}]{status.upper()}[/{COLOR_PROPOSED}]"
-    elif status_lower == SprintStatus.ACTIVE.value:
-        return f"[{COLOR_ACTIVE}]{status.upper()}[/{COLOR_ACTIVE}]"
-    elif status_lower == SprintStatus.REVIEW.value:
-        return f"[{COLOR_REVIEW}]{status.upper()}[/{COLOR_REVIEW}]"
-    elif status_lower == SprintStatus.COMPLETED.value:
-        return f"[{COLOR_COMPLETED}]{status.upper()}[/{COLOR_COMPLETED}]"
-    else:
+    formatted = _FORMATTED_STATUS.get(status.lower())
+    if formatted is None:
         return status.upper()
+    return formatted